@@ -1,11 +1,35 @@
 import typer
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
+from datetime import date
+from tui.console import console
 from helpers.config_ops import get_active_state_file, set_active_state_file
 from models.config_model import load_config, save_config, LocaleConfig
-from helpers.formatting import refresh_formatter
+from helpers.formatting import LocaleFormatter, get_formatter, refresh_formatter
+from helpers.prompts import ask, confirm
 
-console = Console()
+# Built once at import; set_preset only looks them up
+_LOCALE_PRESETS: dict[str, LocaleConfig] = {
+    "uk": LocaleConfig(
+        currency_symbol="£",
+        currency_position="before",
+        date_format="dd/mm/yyyy",
+        decimal_separator=".",
+        thousands_separator=","
+    ),
+    "us": LocaleConfig(
+        currency_symbol="$",
+        currency_position="before",
+        date_format="mm/dd/yyyy",
+        decimal_separator=".",
+        thousands_separator=","
+    ),
+    "eu": LocaleConfig(
+        currency_symbol="€",
+        currency_position="after",
+        date_format="dd/mm/yyyy",
+        decimal_separator=",",
+        thousands_separator="."
+    )
+}
 
 config_app = typer.Typer(help="Configuration commands.", no_args_is_help=True)
 
@@ -30,27 +54,26 @@ locale_app = typer.Typer(help="Locale configuration commands.", no_args_is_help=
 @locale_app.command("show")
 def show_locale():
     """Show current locale settings."""
-    config = load_config()
-    locale = config.locale
-    
-    console.print("[bold]Current Locale Settings:[/bold]")
-    console.print(f"  Currency Symbol: [cyan]{locale.currency_symbol}[/cyan]")
-    console.print(f"  Currency Position: [cyan]{locale.currency_position}[/cyan] (before/after amount)")
-    console.print(f"  Date Format: [cyan]{locale.date_format}[/cyan]")
-    console.print(f"  Decimal Separator: [cyan]{locale.decimal_separator}[/cyan]")
-    console.print(f"  Thousands Separator: [cyan]{locale.thousands_separator}[/cyan]")
-    
-    # Show examples
-    from helpers.formatting import LocaleFormatter
-    formatter = LocaleFormatter(locale)
-    from datetime import date
+    _print_locale_settings(get_formatter())
+
+def _print_locale_settings(formatter: LocaleFormatter) -> None:
+    """Print the formatter's locale settings with formatting examples."""
+    locale = formatter.config
     today = date.today()
-    
-    console.print("\n[bold]Examples:[/bold]")
-    console.print(f"  Currency: [yellow]{formatter.format_currency(1234.56)}[/yellow]")
-    console.print(f"  Short date: [yellow]{formatter.format_date_short(today)}[/yellow]")
-    console.print(f"  Full date: [yellow]{formatter.format_date_full(today)}[/yellow]")
-    console.print(f"  Percentage: [yellow]{formatter.format_percentage(15.5)}[/yellow]")
+    console.print("\n".join([
+        "[bold]Current Locale Settings:[/bold]",
+        f"  Currency Symbol: [cyan]{locale.currency_symbol}[/cyan]",
+        f"  Currency Position: [cyan]{locale.currency_position}[/cyan] (before/after amount)",
+        f"  Date Format: [cyan]{locale.date_format}[/cyan]",
+        f"  Decimal Separator: [cyan]{locale.decimal_separator}[/cyan]",
+        f"  Thousands Separator: [cyan]{locale.thousands_separator}[/cyan]",
+        "",
+        "[bold]Examples:[/bold]",
+        f"  Currency: [yellow]{formatter.format_currency(1234.56)}[/yellow]",
+        f"  Short date: [yellow]{formatter.format_date_short(today)}[/yellow]",
+        f"  Full date: [yellow]{formatter.format_date_full(today)}[/yellow]",
+        f"  Percentage: [yellow]{formatter.format_percentage(15.5)}[/yellow]",
+    ]))
 
 @locale_app.command("set")
 def set_locale():
@@ -58,41 +81,43 @@ def set_locale():
     config = load_config()
     current = config.locale
     
-    console.print("[bold]Current settings:[/bold]")
-    console.print(f"  Currency Symbol: [cyan]{current.currency_symbol}[/cyan]")
-    console.print(f"  Currency Position: [cyan]{current.currency_position}[/cyan]")
-    console.print(f"  Date Format: [cyan]{current.date_format}[/cyan]")
-    console.print("")
+    console.print("\n".join([
+        "[bold]Current settings:[/bold]",
+        f"  Currency Symbol: [cyan]{current.currency_symbol}[/cyan]",
+        f"  Currency Position: [cyan]{current.currency_position}[/cyan]",
+        f"  Date Format: [cyan]{current.date_format}[/cyan]",
+        "",
+    ]))
     
     # Currency symbol
-    currency_symbol = Prompt.ask(
+    currency_symbol = ask(
         "Currency symbol",
         default=current.currency_symbol
     )
     
     # Currency position
-    currency_position = Prompt.ask(
+    currency_position = ask(
         "Currency position",
         choices=["before", "after"],
         default=current.currency_position
     )
     
     # Date format
-    date_format = Prompt.ask(
+    date_format = ask(
         "Date format",
         choices=["dd/mm/yyyy", "mm/dd/yyyy"],
         default=current.date_format
     )
     
     # Decimal separator
-    decimal_separator = Prompt.ask(
+    decimal_separator = ask(
         "Decimal separator",
         choices=[".", ","],
         default=current.decimal_separator
     )
     
     # Thousands separator
-    thousands_separator = Prompt.ask(
+    thousands_separator = ask(
         "Thousands separator",
         choices=[",", ".", " ", ""],
         default=current.thousands_separator
@@ -107,22 +132,26 @@ def set_locale():
         thousands_separator=thousands_separator
     )
     
+    if new_locale == current:
+        console.print("[dim]No changes to locale settings.[/dim]")
+        return
+    
     # Show preview
-    from helpers.formatting import LocaleFormatter
     formatter = LocaleFormatter(new_locale)
-    from datetime import date
     today = date.today()
     
-    console.print("\n[bold]Preview with new settings:[/bold]")
-    console.print(f"  Currency: [yellow]{formatter.format_currency(1234.56)}[/yellow]")
-    console.print(f"  Short date: [yellow]{formatter.format_date_short(today)}[/yellow]")
-    console.print(f"  Full date: [yellow]{formatter.format_date_full(today)}[/yellow]")
+    console.print("\n".join([
+        "\n[bold]Preview with new settings:[/bold]",
+        f"  Currency: [yellow]{formatter.format_currency(1234.56)}[/yellow]",
+        f"  Short date: [yellow]{formatter.format_date_short(today)}[/yellow]",
+        f"  Full date: [yellow]{formatter.format_date_full(today)}[/yellow]",
+    ]))
     
     # Confirm and save
-    if Confirm.ask("\nSave these settings?", default=True):
+    if confirm("\nSave these settings?", default=True):
         config.locale = new_locale
         save_config(config)
-        refresh_formatter()  # Refresh the global formatter
+        refresh_formatter(new_locale)  # Refresh the global formatter
         console.print("[bold green]Locale settings updated successfully![/bold green]")
     else:
         console.print("[yellow]Settings not saved.[/yellow]")
@@ -132,43 +161,19 @@ def set_preset(
     preset: str = typer.Argument(..., help="Preset name: uk, us, eu")
 ):
     """Set locale to a predefined preset."""
-    presets = {
-        "uk": LocaleConfig(
-            currency_symbol="£",
-            currency_position="before",
-            date_format="dd/mm/yyyy",
-            decimal_separator=".",
-            thousands_separator=","
-        ),
-        "us": LocaleConfig(
-            currency_symbol="$",
-            currency_position="before",
-            date_format="mm/dd/yyyy",
-            decimal_separator=".",
-            thousands_separator=","
-        ),
-        "eu": LocaleConfig(
-            currency_symbol="€",
-            currency_position="after",
-            date_format="dd/mm/yyyy",
-            decimal_separator=",",
-            thousands_separator="."
-        )
-    }
-    
     preset_lower = preset.lower()
-    if preset_lower not in presets:
-        console.print(f"[red]Unknown preset '{preset}'. Available presets: uk, us, eu[/red]")
+    if preset_lower not in _LOCALE_PRESETS:
+        console.print(f"[red]Unknown preset '{preset}'. Available presets: {', '.join(_LOCALE_PRESETS)}[/red]")
         return
     
     config = load_config()
-    config.locale = presets[preset_lower]
+    config.locale = _LOCALE_PRESETS[preset_lower]
     save_config(config)
-    refresh_formatter()
+    refresh_formatter(config.locale)
     
     console.print(f"[bold green]Locale set to {preset.upper()} preset![/bold green]")
     
-    # Show the new settings
-    show_locale()
+    # Show the new settings without reloading the config we just saved
+    _print_locale_settings(get_formatter())
 
 config_app.add_typer(locale_app, name="locale")
@@ -1,30 +1,61 @@
 import typer
-from rich.console import Console
-from rich.prompt import Prompt, IntPrompt, Confirm
-from datetime import date, datetime
-from typing import Optional
+from tui.console import console
+from datetime import date
+from typing import Callable, Optional, TextIO
 from models.schedule_options import ScheduleOptions
 from helpers.state_ops import load_state, save_state
-from helpers.validation import validate_month, validate_year, validate_projection_months, validate_cutoff_day
+from helpers.validation import validate_show_args, validate_projection_months, validate_cutoff_day
 from models.state_file import StateFile
-from scheduler.payment_scheduler import PaymentScheduler
-from tui.payment_schedule_display import PaymentScheduleDisplay
-from exporters.csv_exporter import CsvExporter
 
-console = Console()
 app = typer.Typer(no_args_is_help=True)
 
 # Create subcommands
 config_app = typer.Typer(no_args_is_help=True)
 app.add_typer(config_app, name="config", help="Manage schedule configuration")
 
+def _write_html(path: str, write_html: Callable[[TextIO], None]) -> None:
+    """Stream a generated HTML schedule to disk; write_html receives the open file."""
+    with open(path, 'w', encoding='utf-8') as f:
+        write_html(f)
+    console.print(f"\n[green]Exported to {path}[/green]")
+
+def _export_pdf(result, payee_name: Optional[str], show_zero_contribution: bool) -> None:
+    """Export the household schedule (payee_name=None) or one payee's schedule to PDF."""
+    try:
+        from exporters.pdf_exporter import PdfExporter
+        from helpers.config_ops import get_active_state_file
+        import os
+        
+        # Generate filename from state file name (and payee name, if any)
+        state_filename = get_active_state_file()
+        base_name = os.path.splitext(os.path.basename(state_filename))[0]
+        if payee_name:
+            # Clean payee name for filename (replace spaces and special characters)
+            clean_payee_name = payee_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
+            pdf_filename = f"{base_name}-{clean_payee_name}.pdf"
+        else:
+            pdf_filename = f"{base_name}.pdf"
+        
+        PdfExporter.export_schedule_to_pdf(
+            result=result,
+            output_path=pdf_filename,
+            payee_name=payee_name,  # None means household schedule
+            show_zero_contribution=show_zero_contribution
+        )
+        console.print(f"\n[green]Exported professional PDF to {pdf_filename}[/green]")
+        
+    except ImportError as e:
+        console.print(f"\n[red]PDF export failed: {e}[/red]")
+        console.print("[yellow]Install PDF dependencies with: pip install -e '.[pdf]'[/yellow]")
+
 @app.command()
 def show(
     months: Optional[int] = typer.Option(None, "--months", "-m", help="Number of months to project"),
     start_month: Optional[int] = typer.Option(None, "--start-month", help="Starting month (1-12)"),
     start_year: Optional[int] = typer.Option(None, "--start-year", help="Starting year"),
     export_csv: Optional[str] = typer.Option(None, "--export", help="Export to CSV file"),
-    export_pdf: bool = typer.Option(False, "--pdf", help="Export to PDF file (auto-generates filename)"),
+    export_parquet: Optional[str] = typer.Option(None, "--parquet", help="Export to Parquet file"),
+    export_pdf: bool = typer.Option(False, "--pdf", help="Export to PDF file (auto-generates filename); skips the on-screen table"),
     export_html: Optional[str] = typer.Option(None, "--html", help="Export to HTML file"),
     show_zero_contribution: bool = typer.Option(False, "--show-zero", help="Show income streams with 0% contribution")
 ) -> None:
@@ -39,9 +70,7 @@ def show(
     
     # Validate inputs
     try:
-        target_month = validate_month(target_month)
-        target_year = validate_year(target_year)
-        projection_months = validate_projection_months(projection_months)
+        target_month, target_year, projection_months = validate_show_args(target_month, target_year, projection_months)
     except ValueError as e:
         console.print(f"[red]Error: {e}[/red]")
         return
@@ -55,7 +84,14 @@ def show(
     console.print(f"Bills: {len(state.bills)}, Payees: {len(state.payees)}")
     console.print("")
     
+    # A projection needs both bills and payees; don't build the scheduler otherwise
+    if not state.bills or not state.payees:
+        console.print("[yellow]No schedule items generated. Check your bill and payee configurations.[/yellow]")
+        return
+    
     # Create scheduler and generate projection
+    from scheduler.payment_scheduler import PaymentScheduler
+    
     scheduler = PaymentScheduler(state)
     result = scheduler.calculate_proportional_contributions(
         start_month=target_month,
@@ -67,47 +103,34 @@ def show(
         console.print("[yellow]No schedule items generated. Check your bill and payee configurations.[/yellow]")
         return
     
-    # Display the table
-    display = PaymentScheduleDisplay(console)
-    display.display_pivot_table(result, show_zero_contribution)
+    # Display the table, unless the PDF is the requested output
+    if not export_pdf:
+        from tui.payment_schedule_display import PaymentScheduleDisplay
+        display = PaymentScheduleDisplay(console)
+        display.display_pivot_table(result, show_zero_contribution)
     
     # Export if requested
     if export_csv:
+        from exporters.csv_exporter import CsvExporter
         CsvExporter.export_payment_schedule(result, export_csv)
         console.print(f"\n[green]Exported to {export_csv}[/green]")
     
+    if export_parquet:
+        try:
+            from exporters.parquet_exporter import ParquetExporter
+            ParquetExporter.export_payment_schedule(result, export_parquet)
+            console.print(f"\n[green]Exported to {export_parquet}[/green]")
+        except ImportError as e:
+            from rich.markup import escape
+            console.print(f"\n[red]Parquet export failed: {escape(str(e))}[/red]")
+    
     if export_html:
         from exporters.html_generator import ProfessionalHtmlGenerator
         generator = ProfessionalHtmlGenerator()
-        html_content = generator.generate_household_schedule_html(result, show_zero_contribution)
-        
-        with open(export_html, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        console.print(f"\n[green]Exported to {export_html}[/green]")
+        _write_html(export_html, lambda out: generator.write_household_schedule_html(result, out, show_zero_contribution))
     
     if export_pdf:
-        try:
-            from exporters.pdf_exporter import PdfExporter
-            from helpers.config_ops import get_active_state_file
-            import os
-            
-            # Generate filename from state file name
-            state_filename = get_active_state_file()
-            base_name = os.path.splitext(os.path.basename(state_filename))[0]
-            pdf_filename = f"{base_name}.pdf"
-            
-            # Use the unified PDF export (household schedule)
-            PdfExporter.export_schedule_to_pdf(
-                result=result,
-                output_path=pdf_filename,
-                payee_name=None,  # None means household schedule
-                show_zero_contribution=show_zero_contribution
-            )
-            console.print(f"\n[green]Exported professional PDF to {pdf_filename}[/green]")
-            
-        except ImportError as e:
-            console.print(f"\n[red]PDF export failed: {e}[/red]")
-            console.print("[yellow]Install PDF dependencies with: pip install -e '.[pdf]'[/yellow]")
+        _export_pdf(result, None, show_zero_contribution)
 
 @app.command()
 def payee(
@@ -115,7 +138,7 @@ def payee(
     months: Optional[int] = typer.Option(None, "--months", "-m", help="Number of months to project"),
     start_month: Optional[int] = typer.Option(None, "--start-month", help="Starting month (1-12)"),
     start_year: Optional[int] = typer.Option(None, "--start-year", help="Starting year"),
-    export_pdf: bool = typer.Option(False, "--pdf", help="Export to PDF file (auto-generates filename)"),
+    export_pdf: bool = typer.Option(False, "--pdf", help="Export to PDF file (auto-generates filename); skips the on-screen table"),
     export_html: Optional[str] = typer.Option(None, "--html", help="Export to HTML file"),
     show_zero_contribution: bool = typer.Option(False, "--show-zero", help="Show income streams with 0% contribution")
 ) -> None:
@@ -123,12 +146,7 @@ def payee(
     state: StateFile = load_state()
     
     # Check if payee exists
-    payee = None
-    for p in state.payees:
-        if p.name.lower() == payee_name.lower():
-            payee = p
-            payee_name = p.name  # Use exact case from state
-            break
+    payee = state.find_payee(payee_name)
     
     if not payee:
         console.print(f"[red]Payee '{payee_name}' not found.[/red]")
@@ -136,6 +154,7 @@ def payee(
         for p in state.payees:
             console.print(f"  • {p.name}")
         return
+    payee_name = payee.name  # Use exact case from state
     
     # Use defaults if not specified
     projection_months = months or state.schedule_options.default_projection_months
@@ -145,9 +164,7 @@ def payee(
     
     # Validate inputs
     try:
-        target_month = validate_month(target_month)
-        target_year = validate_year(target_year)
-        projection_months = validate_projection_months(projection_months)
+        target_month, target_year, projection_months = validate_show_args(target_month, target_year, projection_months)
     except ValueError as e:
         console.print(f"[red]Error: {e}[/red]")
         return
@@ -161,9 +178,13 @@ def payee(
     console.print(f"Bills: {len(state.bills)}, Income streams: {len(payee.pay_schedules)}")
     console.print("")
     
+    # Without bills the projection is empty; don't build the scheduler
+    if not state.bills:
+        console.print("[yellow]No schedule items generated. Check your bill and payee configurations.[/yellow]")
+        return
+    
     # Create scheduler and generate projection
     from scheduler.payment_scheduler import PaymentScheduler
-    from tui.payment_schedule_display import PaymentScheduleDisplay
     
     scheduler = PaymentScheduler(state)
     result = scheduler.calculate_proportional_contributions(
@@ -176,46 +197,21 @@ def payee(
         console.print("[yellow]No schedule items generated. Check your bill and payee configurations.[/yellow]")
         return
     
-    # Display the payee-specific table
-    display = PaymentScheduleDisplay(console)
-    display.display_payee_schedule(result, payee_name, show_zero_contribution)
+    # Display the payee-specific table, unless the PDF is the requested output
+    if not export_pdf:
+        from tui.payment_schedule_display import PaymentScheduleDisplay
+        display = PaymentScheduleDisplay(console)
+        display.display_payee_schedule(result, payee_name, show_zero_contribution)
     
     # Export to HTML if requested
     if export_html:
         from exporters.html_generator import ProfessionalHtmlGenerator
         generator = ProfessionalHtmlGenerator()
-        html_content = generator.generate_payee_schedule_html(result, payee_name, show_zero_contribution)
-        
-        with open(export_html, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        console.print(f"\n[green]Exported to {export_html}[/green]")
+        _write_html(export_html, lambda out: generator.write_payee_schedule_html(result, payee_name, out, show_zero_contribution))
     
     # Export to PDF if requested
     if export_pdf:
-        try:
-            from exporters.pdf_exporter import PdfExporter
-            from helpers.config_ops import get_active_state_file
-            import os
-            
-            # Generate filename from state file name and payee name
-            state_filename = get_active_state_file()
-            base_name = os.path.splitext(os.path.basename(state_filename))[0]
-            # Clean payee name for filename (replace spaces and special characters)
-            clean_payee_name = payee_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
-            pdf_filename = f"{base_name}-{clean_payee_name}.pdf"
-            
-            # Use the unified PDF export (payee-specific schedule)
-            PdfExporter.export_schedule_to_pdf(
-                result=result,
-                output_path=pdf_filename,
-                payee_name=payee_name,  # Providing payee_name means payee-specific schedule
-                show_zero_contribution=show_zero_contribution
-            )
-            console.print(f"\n[green]Exported professional PDF to {pdf_filename}[/green]")
-            
-        except ImportError as e:
-            console.print(f"\n[red]PDF export failed: {e}[/red]")
-            console.print("[yellow]Install PDF dependencies with: pip install -e '.[pdf]'[/yellow]")
+        _export_pdf(result, payee_name, show_zero_contribution)
 
 @config_app.command("show")
 def config_show() -> None:
@@ -240,6 +236,8 @@ def config_show() -> None:
 @config_app.command("set")
 def config_set() -> None:
     """Interactively configure schedule options."""
+    from rich.prompt import Prompt, IntPrompt, Confirm
+
     state: StateFile = load_state()
     current_options = state.schedule_options
     
@@ -317,15 +315,17 @@ def config_test() -> None:
     
     console.print("[bold]Cutoff dates for next 6 months:[/bold]")
     console.print(f"Using cutoff day [cyan]{options.cutoff_day}[/cyan] with [magenta]{options.weekend_adjustment}[/magenta] adjustment\n")
-    
-    current_date = date.today()
-    
-    for i in range(6):
-        month = current_date.month + i
-        year = current_date.year
-        while month > 12:
-            month -= 12
-            year += 1
+    _print_cutoff_dates(options)
+
+def _print_cutoff_dates(options, today: Optional[date] = None, months: int = 6) -> None:
+    """Print the cutoff date for each of the next few months, starting from today."""
+    today = today or date.today()
+    start_month, start_year = today.month, today.year
+    
+    for i in range(months):
+        years_ahead, month_index = divmod(start_month - 1 + i, 12)
+        month = month_index + 1
+        year = start_year + years_ahead
         
         cutoff_date = options.get_cutoff_date(month, year)
         month_name = cutoff_date.strftime('%B %Y')
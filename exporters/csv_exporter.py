@@ -1,32 +1,108 @@
 import csv
-from typing import List
-from scheduler.payment_scheduler import PaymentScheduleResult
+import io
+import itertools
+import operator
+from datetime import date
+from typing import Callable, Iterable, Optional
+from scheduler.payment_scheduler import PaymentScheduleItem, PaymentScheduleResult
+
+# One CSV line in the default dialect, for rows that need no quoting
+_ROW_FORMAT = '%s,%s,%s,%s,%s,%s,%s\r\n'
+_AMOUNT_FORMAT = '%.2f'
+_PERCENT_FORMAT = '%.1f%%'
+
+# Fetches all exported fields of an item in one C-level call, in column order
+_ITEM_FIELDS = operator.attrgetter(
+    'payee_name',
+    'schedule_description',
+    'income_amount',
+    'required_contribution',
+    'contribution_percentage',
+    'payment_date',
+    'is_before_cutoff'
+)
+
+
+def _needs_quoting(text: str) -> bool:
+    """Whether csv.writer would quote this field with the default dialect."""
+    return ',' in text or '"' in text or '\n' in text or '\r' in text
+
+
+def _cached_text(value, text_cache: dict) -> str:
+    """Field text as csv.writer writes it: None becomes '', anything else str()."""
+    # Unquoted YAML values such as `description: 2024` arrive as ints
+    text = '' if value is None else str(value)
+    return text_cache.setdefault(text, text)
+
+
+def _format_column(values: list, format_value: Callable) -> list:
+    """Format a column, converting each distinct value only once."""
+    # Salaries, shares and payment dates repeat across many rows
+    formatted = {value: format_value(value) for value in set(values)}
+    return [formatted[value] for value in values]
+
+
+def _format_chunk(items: list, text_cache: dict) -> str:
+    """Format a run of schedule items as CSV lines."""
+    # Pull each field out into its own column once, then zip them back into rows
+    names, descriptions, incomes, contributions, percentages, payment_dates, before_cutoff = zip(*map(_ITEM_FIELDS, items))
+    # Names and generated descriptions repeat on every row; keep one copy of each
+    names = [_cached_text(name, text_cache) for name in names]
+    descriptions = [_cached_text(description, text_cache) for description in descriptions]
+    
+    # date.isoformat() gives the same YYYY-MM-DD text as strftime without
+    # the format-string parsing
+    rows = zip(
+        names,
+        descriptions,
+        _format_column(incomes, _AMOUNT_FORMAT.__mod__),
+        _format_column(contributions, _AMOUNT_FORMAT.__mod__),
+        _format_column(percentages, _PERCENT_FORMAT.__mod__),
+        _format_column(payment_dates, date.isoformat),
+        before_cutoff
+    )
+    
+    # Only the free-text columns can ever need quoting; when none of them do,
+    # plain string formatting produces exactly what csv.writer would
+    if not any(_needs_quoting(text) for text in set(names).union(descriptions) if text):
+        # map() over the bound __mod__ keeps the per-row loop in C
+        return ''.join(map(_ROW_FORMAT.__mod__, rows))
+    
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
 
 
 class CsvExporter:
     """Handles exporting payment schedules to CSV format."""
     
+    # Rows formatted and written per block, keeping memory bounded for long schedules
+    DEFAULT_CHUNK_SIZE = 8192
+    
+    @staticmethod
+    def export_payment_schedule(result: PaymentScheduleResult, filename: str, chunk_size: Optional[int] = None) -> None:
+        """Export payment schedule to CSV file, writing chunk_size rows at a time."""
+        CsvExporter.export_schedule_items(result.schedule_items, filename, chunk_size)
+    
     @staticmethod
-    def export_payment_schedule(result: PaymentScheduleResult, filename: str) -> None:
-        """Export payment schedule to CSV file."""
-        with open(filename, 'w', newline='') as csvfile:
-            fieldnames = [
-                'payee_name', 
-                'schedule_description', 
-                'income_amount', 
-                'required_contribution', 
-                'payment_date', 
-                'is_before_cutoff'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for item in result.schedule_items:
-                writer.writerow({
-                    'payee_name': item.payee_name,
-                    'schedule_description': item.schedule_description,
-                    'income_amount': f"{item.income_amount:.2f}",
-                    'required_contribution': f"{item.required_contribution:.2f}",
-                    'payment_date': item.payment_date.strftime('%Y-%m-%d'),
-                    'is_before_cutoff': item.is_before_cutoff
-                })
\ No newline at end of file
+    def export_schedule_items(items: Iterable[PaymentScheduleItem], filename: str, chunk_size: Optional[int] = None) -> None:
+        """Export schedule items to CSV file; items may be a generator, only one chunk is held at a time."""
+        fieldnames = [
+            'payee_name', 
+            'schedule_description', 
+            'income_amount', 
+            'required_contribution', 
+            'contribution_percentage', 
+            'payment_date', 
+            'is_before_cutoff'
+        ]
+        chunk_size = chunk_size or CsvExporter.DEFAULT_CHUNK_SIZE
+        text_cache = {}
+        
+        # Typical schedules fit in one chunk and so go out in a single write.
+        # Each chunk is encoded once and written to a binary file, skipping the
+        # text layer's per-write newline translation and encoding
+        with open(filename, 'wb') as csvfile:
+            csvfile.write((','.join(fieldnames) + '\r\n').encode('utf-8'))
+            for chunk in itertools.batched(items, chunk_size):
+                csvfile.write(_format_chunk(chunk, text_cache).encode('utf-8'))
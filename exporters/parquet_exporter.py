@@ -0,0 +1,42 @@
+"""Parquet export functionality for payment schedules."""
+
+from scheduler.payment_scheduler import PaymentScheduleResult
+
+
+class ParquetExporter:
+    """Handles exporting payment schedules to Parquet format."""
+
+    # Rows per row group; small enough to stay cache-friendly when read back
+    ROW_GROUP_SIZE = 8192
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check if Parquet export dependencies are available."""
+        try:
+            import pyarrow
+            return True
+        except ImportError:
+            return False
+
+    @staticmethod
+    def export_payment_schedule(result: PaymentScheduleResult, filename: str) -> None:
+        """Export payment schedule to a Parquet file, keeping amounts and dates typed."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "Parquet export requires pyarrow. Install with: pip install -e '.[parquet]'"
+            )
+
+        items = result.schedule_items
+        table = pa.Table.from_pydict({
+            'payee_name': [item.payee_name for item in items],
+            'schedule_description': [item.schedule_description for item in items],
+            'income_amount': pa.array([item.income_amount for item in items], type=pa.float64()),
+            'required_contribution': pa.array([item.required_contribution for item in items], type=pa.float64()),
+            'contribution_percentage': pa.array([item.contribution_percentage for item in items], type=pa.float64()),
+            'payment_date': pa.array([item.payment_date for item in items], type=pa.date32()),
+            'is_before_cutoff': pa.array([item.is_before_cutoff for item in items], type=pa.bool_()),
+        })
+        pq.write_table(table, filename, row_group_size=ParquetExporter.ROW_GROUP_SIZE)
@@ -1,3 +1,4 @@
+import functools
 import yaml
 import os
 from models.config_model import AppConfig
@@ -16,6 +17,15 @@ def save_config(config: AppConfig):
         yaml.safe_dump(asdict(config), f)
 
 def get_active_state_file() -> str:
+    try:
+        mtime_ns = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    return _read_active_state_file(os.path.abspath(CONFIG_FILE), mtime_ns)
+
+@functools.lru_cache(maxsize=1)
+def _read_active_state_file(config_path: str, mtime_ns: int) -> str:
+    """Read the active state file from config, reused until the config file changes."""
     config = load_config()
     return config.active_state_file
 
@@ -23,3 +33,4 @@ def set_active_state_file(filename: str):
     config = load_config()
     config.active_state_file = filename
     save_config(config)
+    _read_active_state_file.cache_clear()
@@ -71,7 +71,22 @@ def get_formatter() -> LocaleFormatter:
         _formatter = LocaleFormatter()
     return _formatter
 
-def refresh_formatter():
+def refresh_formatter(locale_config: LocaleConfig = None):
     """Refresh the global formatter to pick up config changes."""
     global _formatter
-    _formatter = LocaleFormatter()
\ No newline at end of file
+    _formatter = LocaleFormatter(locale_config)
+
+# Interval name -> (singular, plural) display unit, e.g. 'weekly' -> ('week', 'weeks')
+UNIT_SINGULAR_PLURAL = {
+    'interval': ('interval', 'intervals'),
+    'daily': ('day', 'days'),
+    'weekly': ('week', 'weeks'),
+    'monthly': ('month', 'months'),
+    'quarterly': ('quarter', 'quarters'),
+    'yearly': ('year', 'years'),
+}
+
+def format_interval_unit(interval: str, every: int) -> str:
+    """Return the unit word for a recurrence, pluralised when every != 1."""
+    singular, plural = UNIT_SINGULAR_PLURAL.get(interval, (interval, interval + 's'))
+    return singular if every == 1 else plural
@@ -2,7 +2,7 @@
 
 import colorsys
 import math
-from typing import Tuple, Dict
+from typing import Tuple, Dict, List
 
 
 class PayeeColorGenerator:
@@ -14,6 +14,7 @@ class PayeeColorGenerator:
     
     def __init__(self):
         self._color_cache = {}
+        self._palette_cache: Dict[str, List[str]] = {}
     
     def get_payee_color(self, payee_index: int, format: str = 'hex') -> str:
         """
@@ -55,6 +56,22 @@ class PayeeColorGenerator:
         
         return self._format_color(hue_normalized, saturation, lightness, format)
     
+    def get_palette(self, count: int, format: str = 'hex') -> List[str]:
+        """
+        Get colors for the first count payee indexes, formatted once and reused.
+        
+        Args:
+            count: Number of payees
+            format: 'hex', 'rgb', 'hsl', or 'rich' (Rich console markup)
+            
+        Returns:
+            List of color strings, indexed like get_payee_color
+        """
+        palette = self._palette_cache.setdefault(format, [])
+        for payee_index in range(len(palette), count):
+            palette.append(self.get_payee_color(payee_index, format))
+        return palette[:count]
+    
     def _format_color(self, hue: float, saturation: float, lightness: float, format: str) -> str:
         """Convert HSL to requested format."""
         if format == 'hsl':
@@ -131,10 +148,8 @@ class PayeeColorGenerator:
         Returns:
             Dictionary mapping payee names to hex colors
         """
-        colors = {}
-        for i, payee in enumerate(state_file.payees):
-            colors[payee.name] = self.get_payee_color(i, 'hex')
-        return colors
+        palette = self.get_palette(len(state_file.payees), 'hex')
+        return {payee.name: color for payee, color in zip(state_file.payees, palette)}
 
 
 def demo_colors():
@@ -0,0 +1,103 @@
+"""Interactive prompt helpers that re-ask only the field that failed validation."""
+
+import sys
+from datetime import date
+from typing import List, Optional
+from tui.console import console
+
+
+def ask(message: str, default: Optional[str] = None, choices: Optional[List[str]] = None) -> str:
+    """
+    Ask for a string, reading plain input() when stdin is not a terminal.
+
+    Scripted or piped input skips Rich's prompt rendering entirely; the answer
+    is still checked against choices and falls back to default when empty.
+
+    Args:
+        message: Prompt text
+        default: Value returned for an empty answer
+        choices: Allowed answers, if restricted
+
+    Returns:
+        str: The answer
+    """
+    if sys.stdin.isatty():
+        from rich.prompt import Prompt
+        if default is None:
+            return Prompt.ask(message, choices=choices)
+        return Prompt.ask(message, choices=choices, default=default)
+
+    while True:
+        value = input(f"{message}: ").strip()
+        if not value and default is not None:
+            return default
+        if choices is None or value in choices:
+            return value
+        console.print(f"[red]Please select one of: {', '.join(choices)}[/red]")
+
+
+def confirm(message: str, default: bool = False) -> bool:
+    """
+    Ask a yes/no question, reading plain input() when stdin is not a terminal.
+
+    Args:
+        message: Prompt text
+        default: Value returned for an empty answer
+
+    Returns:
+        bool: True for yes
+    """
+    if sys.stdin.isatty():
+        from rich.prompt import Confirm
+        return Confirm.ask(message, default=default)
+
+    while True:
+        value = input(f"{message} [y/n]: ").strip().lower()
+        if not value:
+            return default
+        if value in ("y", "yes"):
+            return True
+        if value in ("n", "no"):
+            return False
+        console.print("[red]Please enter Y or N[/red]")
+
+
+def prompt_date(message: str, default: str = "", optional: bool = False) -> Optional[date]:
+    """
+    Prompt for a YYYY-MM-DD date until a valid one is entered.
+
+    Args:
+        message: Prompt text
+        default: Default value shown to the user
+        optional: Whether an empty answer is accepted
+
+    Returns:
+        date: Parsed date, or None if optional and left empty
+    """
+    while True:
+        value: str = ask(message, default=default)
+        if optional and not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            console.print("[red]Invalid date format. Please try again.[/red]")
+
+
+def prompt_int(message: str, default: int = 1) -> int:
+    """
+    Prompt for an integer until a valid one is entered.
+
+    Args:
+        message: Prompt text
+        default: Default value shown to the user
+
+    Returns:
+        int: Parsed integer
+    """
+    while True:
+        value: str = ask(message, default=str(default))
+        try:
+            return int(value)
+        except ValueError:
+            console.print("[red]Must be an integer. Please try again.[/red]")
@@ -1,15 +1,38 @@
+import functools
+import hashlib
+import tempfile
 import yaml
 import os
 from helpers.config_ops import get_active_state_file
 
 from models.state_file import StateFile
 
+# Prefer libyaml's C loader/dumper; they are several times faster than the pure-Python ones
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# Digest of the bytes last read from or written to each state file
+_state_digests: dict[str, bytes] = {}
+
 def load_state():
     filename = get_active_state_file()
+    try:
+        stat = os.stat(filename)
+        return _load_state_file(filename, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        return _load_state_file(filename, None, None)
+
+@functools.lru_cache(maxsize=1)
+def _load_state_file(filename: str, mtime_ns: int, size: int) -> StateFile:
+    """Parse the state file, reusing the result until its mtime or size changes."""
     if os.path.exists(filename):
         try:
-            with open(filename, 'r') as f:
-                data = yaml.safe_load(f) or {}
+            with open(filename, 'rb') as f:
+                raw = f.read()
+            _state_digests[filename] = hashlib.sha256(raw).digest()
+            data = yaml.load(raw, Loader=_SafeLoader) or {}
             
             # Validate state structure before creating StateFile
             validation_errors = _validate_state_structure(data, filename)
@@ -235,18 +258,38 @@ def _find_error_line(filename: str, error_msg: str) -> str:
     except:
         return ""
 
-def make_yaml_safe(obj):
-    if isinstance(obj, dict):
-        return {k: make_yaml_safe(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [make_yaml_safe(v) for v in obj]
-    elif hasattr(obj, "__dict__"):
-        return make_yaml_safe(obj.__dict__)
-    else:
-        return obj
+def _current_umask() -> int:
+    """The process umask; it can only be read by setting it, so put it straight back."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
 
 def save_state(state_file: StateFile):
     filename = get_active_state_file()
-    safe_state = make_yaml_safe(state_file.to_dict())
-    with open(filename, 'w') as f:
-        yaml.safe_dump(safe_state, f)
+    # to_dict() already yields plain dicts, lists, scalars and dates
+    content = yaml.dump(state_file.to_dict(), Dumper=_SafeDumper).encode('utf-8')
+    digest = hashlib.sha256(content).digest()
+    if _state_digests.get(filename) == digest and os.path.exists(filename):
+        return  # Nothing changed since the file was loaded or last saved
+
+    # Write to a temp file alongside the target and swap it in, so an
+    # interrupted save never leaves a truncated state file behind. Resolve
+    # symlinks first so a linked state file updates its target, not the link.
+    target = os.path.realpath(filename)
+    directory = os.path.dirname(target)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.how2pay-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        # mkstemp creates the file 0600; keep the target's mode, or give a new
+        # file the mode open() would have (0666 less the umask)
+        if os.path.exists(target):
+            os.chmod(temp_path, os.stat(target).st_mode & 0o777)
+        else:
+            os.chmod(temp_path, 0o666 & ~_current_umask())
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    _state_digests[filename] = digest
+    _load_state_file.cache_clear()
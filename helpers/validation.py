@@ -1,6 +1,6 @@
 """Input validation helpers for the finance application."""
 
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 from datetime import date
 
 
@@ -100,6 +100,34 @@ def validate_projection_months(months: Union[int, str]) -> int:
         raise ValueError(f"Invalid months format: {months}")
 
 
+def validate_show_args(month: Union[int, str], year: Union[int, str],
+                       months: Union[int, str]) -> Tuple[int, int, int]:
+    """
+    Validate the start month, start year and projection length of a schedule command.
+    
+    Args:
+        month: Starting month as int or string
+        year: Starting year as int or string
+        months: Number of months to project as int or string
+        
+    Returns:
+        tuple: (month, year, months) as validated ints
+        
+    Raises:
+        ValueError: Listing every invalid argument, separated by '; '
+    """
+    validated = []
+    errors = []
+    for validator, value in ((validate_month, month), (validate_year, year), (validate_projection_months, months)):
+        try:
+            validated.append(validator(value))
+        except ValueError as e:
+            errors.append(str(e))
+    if errors:
+        raise ValueError("; ".join(errors))
+    return tuple(validated)
+
+
 def validate_cutoff_day(day: Union[int, str]) -> int:
     """
     Validate cutoff day is between 1 and 31.
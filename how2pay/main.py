@@ -1,14 +1,10 @@
 #!/Users/sherman/Finances/.venv/bin/python
 
 
-from commands.bills_cmd import app as bills_app
-from commands.payee_cmd import app as payee_app
-from commands.config_cmd import config_app 
-from commands.schedule_cmd import app as schedule_app 
-
-
-from rich.console import Console
+import importlib
+from tui.console import console
 import typer
+from typer.core import TyperGroup
 from typing import Optional
 
 from helpers.state_ops import save_state
@@ -17,7 +13,31 @@ from helpers.config_ops import set_active_state_file
 
 DEFAULT_STATE_FILE = 'how2pay_state.yaml'
 
-console = Console()
+
+# Sub-apps are imported only when their command group is actually invoked
+LAZY_SUBCOMMANDS = {
+    "bills": ("commands.bills_cmd", "app"),
+    "payee": ("commands.payee_cmd", "app"),
+    "config": ("commands.config_cmd", "config_app"),
+    "schedule": ("commands.schedule_cmd", "app"),
+}
+
+
+class LazySubcommandGroup(TyperGroup):
+    """Top-level group that resolves sub-app modules on first lookup."""
+
+    def list_commands(self, ctx):
+        commands = super().list_commands(ctx)
+        return commands + [name for name in LAZY_SUBCOMMANDS if name not in commands]
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in LAZY_SUBCOMMANDS:
+            module_name, attr = LAZY_SUBCOMMANDS[cmd_name]
+            sub_app = getattr(importlib.import_module(module_name), attr)
+            group = typer.main.get_group(sub_app)
+            group.name = cmd_name
+            self.add_command(group, cmd_name)
+        return super().get_command(ctx, cmd_name)
 
 
 def version_callback(value: bool):
@@ -26,15 +46,11 @@ def version_callback(value: bool):
         raise typer.Exit()
 
 app = typer.Typer(
+    cls=LazySubcommandGroup,
     short_help="How2Pay CLI",
     help="How2Pay CLI - Manage your bills and payees.",
     no_args_is_help=True)
 
-app.add_typer(bills_app, name="bills")
-app.add_typer(payee_app, name="payee")
-app.add_typer(config_app, name="config")
-app.add_typer(schedule_app, name="schedule")
-
 @app.command()
 def init(filename: str = DEFAULT_STATE_FILE):
     """Initialize a state file and set it as active context."""
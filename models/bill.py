@@ -14,6 +14,10 @@ class BillShare:
         """
         self.exclude = exclude or []
         self.custom = custom or {}  # payee_name -> percentage
+
+    def custom_total_hundredths(self) -> int:
+        """Total of the custom percentages in whole hundredths of a percent (10000 == 100%)."""
+        return round(sum(self.custom.values()) * 100)
     
     @staticmethod
     def from_dict(data) -> 'BillShare':
@@ -136,14 +140,6 @@ class Bill:
         )
 
     def to_dict(self) -> dict:
-        # Serialize share information
-        share_data = []
-        for share_item in self.share:
-            share_data.append({
-                'payee': share_item.payee,
-                'percentage': share_item.percentage
-            })
-        
         # Serialize price history
         price_history_data = []
         for history_item in self.price_history:
@@ -152,7 +148,7 @@ class Bill:
         return {
             'name': self.name,
             'price_history': price_history_data,
-            'share': share_data,
+            'share': self.share.to_dict(),
             'ends': self.ends,
             'description': self.description
         }
@@ -229,11 +225,27 @@ class Bill:
         
         return result
     
+    @property
+    def shares(self) -> dict:
+        """Custom split as {payee_name: percentage}; a live view of share.custom."""
+        return self.share.custom
+    
+    @shares.setter
+    def shares(self, shares: dict) -> None:
+        self.share.custom = dict(shares)
+    
+    def set_payee_percentage(self, payee_name: str, percentage: float) -> None:
+        """Set a payee's custom percentage; 0 removes their custom entry."""
+        if percentage > 0:
+            self.share.custom[payee_name] = percentage
+        else:
+            self.share.custom.pop(payee_name, None)
+    
     def get_payee_percentage(self, payee_name: str, all_payees: List = None) -> float:
         """Get the percentage for a specific payee."""
         if all_payees is None:
             # Fallback to old behavior for backward compatibility
-            return self.share.custom.get(payee_name, 0.0)
+            return self.shares.get(payee_name, 0.0)
         
         shares = self.calculate_payee_shares(all_payees)
         return shares.get(payee_name, 0.0)
@@ -104,9 +104,8 @@ class Recurrence:
                     year = current_date.year
                     day = current_date.day
                     
-                    while month > 12:
-                        month -= 12
-                        year += 1
+                    year += (month - 1) // 12
+                    month = (month - 1) % 12 + 1
                     
                     try:
                         current_date = date(year, month, day)
@@ -149,9 +148,8 @@ class Recurrence:
             else:
                 month += 1
             
-            while month > 12:
-                month -= 12
-                year += 1
+            year += (month - 1) // 12
+            month = (month - 1) % 12 + 1
             
             try:
                 next_date = date(year, month, day)
@@ -181,9 +179,8 @@ class Recurrence:
             year = current_date.year
             day = current_date.day
             
-            while month > 12:
-                month -= 12
-                year += 1
+            year += (month - 1) // 12
+            month = (month - 1) % 12 + 1
             
             try:
                 current_date = date(year, month, day)
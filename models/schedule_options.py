@@ -1,7 +1,32 @@
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Literal, Optional
 from calendar import monthrange
 
+
+@lru_cache(maxsize=4096)
+def _compute_cutoff(cutoff_day: int, weekend_adjustment: str, month: int, year: int) -> date:
+    """Weekend-adjusted cutoff date; cached since projections ask for the same months repeatedly."""
+    # Handle case where cutoff_day is beyond the month's days
+    last_day = monthrange(year, month)[1]
+    actual_day = min(cutoff_day, last_day)
+    
+    cutoff_date = date(year, month, actual_day)
+    
+    # Adjust for weekends (Saturday = 5, Sunday = 6)
+    if cutoff_date.weekday() >= 5:  # Weekend
+        if weekend_adjustment == 'last_working_day':
+            # Move backwards to Friday
+            days_back = cutoff_date.weekday() - 4  # 5-4=1 for Sat, 6-4=2 for Sun
+            cutoff_date = cutoff_date - timedelta(days=days_back)
+        else:  # next_working_day
+            # Move forward to Monday
+            days_forward = 7 - cutoff_date.weekday()  # 7-5=2 for Sat, 7-6=1 for Sun
+            cutoff_date = cutoff_date + timedelta(days=days_forward)
+    
+    return cutoff_date
+
+
 class ScheduleOptions:
     def __init__(
         self,
@@ -30,24 +55,7 @@ class ScheduleOptions:
 
     def get_cutoff_date(self, month: int, year: int) -> date:
         """Get the actual cutoff date for a given month/year, adjusted for weekends."""
-        # Handle case where cutoff_day is beyond the month's days
-        last_day = monthrange(year, month)[1]
-        actual_day = min(self.cutoff_day, last_day)
-        
-        cutoff_date = date(year, month, actual_day)
-        
-        # Adjust for weekends (Saturday = 5, Sunday = 6)
-        if cutoff_date.weekday() >= 5:  # Weekend
-            if self.weekend_adjustment == 'last_working_day':
-                # Move backwards to Friday
-                days_back = cutoff_date.weekday() - 4  # 5-4=1 for Sat, 6-4=2 for Sun
-                cutoff_date = cutoff_date - timedelta(days=days_back)
-            else:  # next_working_day
-                # Move forward to Monday
-                days_forward = 7 - cutoff_date.weekday()  # 7-5=2 for Sat, 7-6=1 for Sun
-                cutoff_date = cutoff_date + timedelta(days=days_forward)
-        
-        return cutoff_date
+        return _compute_cutoff(self.cutoff_day, self.weekend_adjustment, month, year)
 
     def get_current_month_cutoff(self, reference_date: Optional[date] = None) -> date:
         """Get the cutoff date for the current month."""
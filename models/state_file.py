@@ -28,3 +28,8 @@ class StateFile:
             'payees': [p.to_dict() for p in self.payees],
             'schedule_options': self.schedule_options.to_dict()
         }
+
+    def find_payee(self, name: str) -> Optional[Payee]:
+        """Case-insensitive payee lookup; the first match wins."""
+        name = name.lower()
+        return next((p for p in self.payees if p.name.lower() == name), None)
@@ -88,15 +88,8 @@ class PaymentScheduler:
     
     def _adjust_month_year(self, month: int, year: int) -> Tuple[int, int]:
         """Handle month/year rollover (e.g., month 13 -> month 1, year+1)."""
-        adjusted_year = year
-        adjusted_month = month
-        while adjusted_month > 12:
-            adjusted_month -= 12
-            adjusted_year += 1
-        while adjusted_month < 1:
-            adjusted_month += 12
-            adjusted_year -= 1
-        return adjusted_month, adjusted_year
+        years_offset, month_index = divmod(month - 1, 12)
+        return month_index + 1, year + years_offset
     
     def _is_before_projection_start(self, month: int, year: int) -> bool:
         """Check if a month/year is before the projection start date."""
@@ -616,6 +609,25 @@ class PaymentScheduler:
         
         return bills_due
 
+    @staticmethod
+    def _find_extremes(monthly_amounts) -> Tuple[float, float, List, List]:
+        """Find the min and max amount and the month keys where each occurs, in one pass."""
+        min_amount = max_amount = 0.0
+        min_keys = []
+        max_keys = []
+        for key, amount in monthly_amounts:
+            if not min_keys or amount < min_amount:
+                min_amount = amount
+                min_keys = [key]
+            elif amount == min_amount:
+                min_keys.append(key)
+            if not max_keys or amount > max_amount:
+                max_amount = amount
+                max_keys = [key]
+            elif amount == max_amount:
+                max_keys.append(key)
+        return min_amount, max_amount, min_keys, max_keys
+
     def _generate_analytics(self, schedule_items: List[PaymentScheduleItem], 
                            monthly_bill_totals: List[MonthlyBillTotal]) -> PeriodAnalytics:
         """Generate comprehensive analytics for the payment schedule."""
@@ -625,8 +637,16 @@ class PaymentScheduler:
         payee_monthly_totals = defaultdict(lambda: defaultdict(float))
         
         for item in schedule_items:
-            month_key = item.payment_date.strftime('%Y-%m')
-            payee_monthly_totals[item.payee_name][month_key] += item.required_contribution
+            payment_date = item.payment_date
+            payee_monthly_totals[item.payee_name][(payment_date.year, payment_date.month)] += item.required_contribution
+        
+        # Each month's "January 2025" label is needed by several payees; format it once
+        month_labels = {}
+        def month_label(year: int, month: int) -> str:
+            label = month_labels.get((year, month))
+            if label is None:
+                label = month_labels[(year, month)] = date(year, month, 1).strftime('%B %Y')
+            return label
         
         # Calculate period-level analytics
         monthly_totals = []
@@ -637,18 +657,12 @@ class PaymentScheduler:
         average_monthly_requirement = total_bills_required / len(monthly_totals) if monthly_totals else 0.0
         
         # Find min/max monthly totals and their months
-        min_monthly_total = min(monthly_totals) if monthly_totals else 0.0
-        max_monthly_total = max(monthly_totals) if monthly_totals else 0.0
-        
-        min_months = []
-        max_months = []
-        if monthly_totals:
-            for monthly_total in monthly_bill_totals:
-                month_name = date(monthly_total.year, monthly_total.month, 1).strftime('%B %Y')
-                if monthly_total.total_bills == min_monthly_total:
-                    min_months.append(month_name)
-                if monthly_total.total_bills == max_monthly_total:
-                    max_months.append(month_name)
+        min_monthly_total, max_monthly_total, min_keys, max_keys = self._find_extremes(
+            ((monthly_total.year, monthly_total.month), monthly_total.total_bills)
+            for monthly_total in monthly_bill_totals
+        )
+        min_months = [month_label(*key) for key in min_keys]
+        max_months = [month_label(*key) for key in max_keys]
         
         # Calculate per-payee analytics
         payee_analytics = {}
@@ -656,22 +670,14 @@ class PaymentScheduler:
             if not monthly_totals_dict:
                 continue
                 
-            amounts = list(monthly_totals_dict.values())
-            min_amount = min(amounts)
-            max_amount = max(amounts)
-            total_amount = sum(amounts)
-            average_amount = total_amount / len(amounts)
+            # Find min/max amounts and the months they occur in
+            min_amount, max_amount, min_keys, max_keys = self._find_extremes(monthly_totals_dict.items())
+            total_amount = sum(monthly_totals_dict.values())
+            average_amount = total_amount / len(monthly_totals_dict)
             is_consistent = min_amount == max_amount
             
-            # Find months for min/max amounts
-            min_months_payee = []
-            max_months_payee = []
-            for month_key, amount in monthly_totals_dict.items():
-                month_name = date.fromisoformat(f"{month_key}-01").strftime('%B %Y')
-                if amount == min_amount:
-                    min_months_payee.append(month_name)
-                if amount == max_amount:
-                    max_months_payee.append(month_name)
+            min_months_payee = [month_label(*key) for key in min_keys]
+            max_months_payee = [month_label(*key) for key in max_keys]
             
             # Limit to first 2 months to avoid clutter
             payee_analytics[payee_name] = PayeeAnalytics(
@@ -0,0 +1,62 @@
+import unittest
+from datetime import date
+from unittest.mock import patch
+from typer.testing import CliRunner
+from commands import bills_cmd
+from models.bill import Bill, BillShare
+from models.payee import Payee
+from models.recurrence import Recurrence
+from models.state_file import StateFile
+
+
+class TestHundredthsSplits(unittest.TestCase):
+    """Splits using hundredths of a percent, e.g. 33.33/33.33/33.34."""
+
+    def setUp(self):
+        """Set up a household of three with a custom-split bill."""
+        self.payees = [Payee(name="Alice"), Payee(name="Bob"), Payee(name="Charlie")]
+        recurrence = Recurrence(kind='calendar', interval='monthly', start=date(2025, 1, 1))
+        self.bill = Bill(name="Rent", amount=1500.0, recurrence=recurrence,
+                         share=BillShare(custom={"Alice": 33.33, "Bob": 33.33, "Charlie": 33.34}))
+        self.state = StateFile(bills=[self.bill], payees=self.payees)
+
+    def test_custom_total_hundredths_is_exactly_100(self):
+        self.assertEqual(self.bill.share.custom_total_hundredths(), 10000)
+        is_valid, _ = self.bill.validate_shares(self.payees)
+        self.assertTrue(is_valid)
+
+    def test_custom_total_hundredths_detects_missing_hundredth(self):
+        share = BillShare(custom={"Alice": 33.33, "Bob": 33.33, "Charlie": 33.33})
+        self.assertEqual(share.custom_total_hundredths(), 9999)
+
+    def test_share_lines_have_no_warning(self):
+        lines = bills_cmd._share_lines(self.bill)
+        self.assertFalse(any("WARNING" in line for line in lines))
+
+    def _assign(self, answers):
+        """Run 'bills assign' against self.state, returning (output, saved states)."""
+        saved = []
+        with patch.object(bills_cmd, "load_state", return_value=self.state), \
+             patch.object(bills_cmd, "save_state", side_effect=saved.append):
+            result = CliRunner().invoke(bills_cmd.app, ["assign"], input="\n".join(answers) + "\n")
+        return result.output, saved
+
+    def test_assign_accepts_unchanged_defaults(self):
+        output, saved = self._assign(["1", "", "", ""])
+        self.assertNotIn("Total percentages must equal 100%", output)
+        self.assertIn("No changes", output)
+        self.assertEqual(saved, [])
+
+    def test_assign_stores_typed_hundredths(self):
+        output, saved = self._assign(["1", "33.34", "33.33", "33.33"])
+        self.assertEqual(len(saved), 1, output)
+        self.assertEqual(self.bill.shares, {"Alice": 33.34, "Bob": 33.33, "Charlie": 33.33})
+
+    def test_assign_rejects_total_off_by_a_hundredth(self):
+        output, saved = self._assign(["1", "33.33", "33.33", "33.33"])
+        self.assertIn("got 99.99%", output)
+        self.assertEqual(saved, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
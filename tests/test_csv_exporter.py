@@ -0,0 +1,104 @@
+import csv
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from exporters.csv_exporter import CsvExporter
+from scheduler.payment_scheduler import PaymentScheduleItem
+
+
+def reference_csv(items) -> str:
+    """The export as csv.writer produces it, for comparison with the fast path."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['payee_name', 'schedule_description', 'income_amount', 'required_contribution',
+                     'contribution_percentage', 'payment_date', 'is_before_cutoff'])
+    for item in items:
+        writer.writerow([
+            item.payee_name,
+            item.schedule_description,
+            f"{item.income_amount:.2f}",
+            f"{item.required_contribution:.2f}",
+            f"{item.contribution_percentage:.1f}%",
+            item.payment_date.strftime('%Y-%m-%d'),
+            item.is_before_cutoff,
+        ])
+    return buffer.getvalue()
+
+
+class TestCsvExporterMatchesCsvWriter(unittest.TestCase):
+    """The %-format fast path must produce exactly what csv.writer would."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.filename = os.path.join(self.directory, 'schedule.csv')
+
+    def make_item(self, payee_name="Alice", description="Salary", day=1, amount=1234.5):
+        """Helper method to create a schedule item."""
+        return PaymentScheduleItem(
+            payee_name=payee_name,
+            schedule_description=description,
+            income_amount=amount,
+            required_contribution=amount / 3,
+            contribution_percentage=33.333,
+            payment_date=date(2025, 1, day),
+            is_before_cutoff=day % 2 == 0,
+        )
+
+    def export(self, items, chunk_size=None) -> str:
+        CsvExporter.export_schedule_items(items, self.filename, chunk_size)
+        with open(self.filename, newline='', encoding='utf-8') as f:
+            return f.read()
+
+    def assert_matches_csv_writer(self, items, chunk_sizes=(None, 1, 2, 3)):
+        for chunk_size in chunk_sizes:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.export(items, chunk_size), reference_csv(items))
+
+    def test_plain_fields(self):
+        self.assert_matches_csv_writer([self.make_item(day=day) for day in range(1, 6)])
+
+    def test_fields_needing_quotes(self):
+        self.assert_matches_csv_writer([
+            self.make_item(description="Salary, main job"),
+            self.make_item(description='Bonus "Q1"'),
+            self.make_item(payee_name="Smith, Jo", description="Line one\nline two"),
+            self.make_item(description="Carriage\rreturn"),
+            self.make_item(payee_name="Zoë", description="Über"),
+        ])
+
+    def test_none_fields(self):
+        self.assert_matches_csv_writer([
+            self.make_item(description=None),
+            self.make_item(payee_name=None, description=None),
+        ])
+
+    def test_non_str_fields(self):
+        # Unquoted YAML scalars such as `description: 2024` load as ints
+        self.assert_matches_csv_writer([
+            self.make_item(description=2024),
+            self.make_item(payee_name=7, description=0),
+            self.make_item(description=1.5),
+        ])
+
+    def test_quoting_rows_across_chunk_boundary(self):
+        # Plain and quoted rows land in different chunks for some sizes and share one for others
+        items = [self.make_item(day=day) for day in range(1, 5)]
+        items[2] = self.make_item(description="Rent, shared", day=3)
+        self.assert_matches_csv_writer(items, chunk_sizes=(None, 1, 2, 3, 4, 5))
+
+    def test_generator_input(self):
+        items = [self.make_item(day=day) for day in range(1, 6)]
+        CsvExporter.export_schedule_items(iter(items), self.filename, 2)
+        with open(self.filename, newline='', encoding='utf-8') as f:
+            self.assertEqual(f.read(), reference_csv(items))
+
+    def test_no_items_writes_header_only(self):
+        self.assertEqual(self.export([]), reference_csv([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from helpers.formatting import format_interval_unit
+from helpers.validation import validate_show_args
+
+
+class TestValidateShowArgs(unittest.TestCase):
+    """Tests for validate_show_args."""
+
+    def test_valid_ints_pass_through(self):
+        self.assertEqual(validate_show_args(1, 2025, 12), (1, 2025, 12))
+
+    def test_strings_are_parsed(self):
+        self.assertEqual(validate_show_args("12", "2030", "60"), (12, 2030, 60))
+
+    def test_boundaries_are_accepted(self):
+        self.assertEqual(validate_show_args(12, 2100, 1), (12, 2100, 1))
+        self.assertEqual(validate_show_args(1, 2020, 60), (1, 2020, 60))
+
+    def test_single_invalid_argument(self):
+        with self.assertRaises(ValueError) as ctx:
+            validate_show_args(13, 2025, 12)
+        self.assertEqual(str(ctx.exception), "Month must be between 1 and 12")
+
+    def test_every_invalid_argument_is_reported(self):
+        with self.assertRaises(ValueError) as ctx:
+            validate_show_args(0, 1999, 61)
+        self.assertEqual(
+            str(ctx.exception),
+            "Month must be between 1 and 12; Year must be between 2020 and 2100; "
+            "Projection months must be between 1 and 60"
+        )
+
+    def test_unparseable_values(self):
+        with self.assertRaises(ValueError) as ctx:
+            validate_show_args("jan", 2025, "x")
+        self.assertEqual(str(ctx.exception), "Invalid month format: jan; Invalid months format: x")
+
+
+class TestFormatIntervalUnit(unittest.TestCase):
+    """Tests for format_interval_unit."""
+
+    def test_singular_when_every_is_one(self):
+        self.assertEqual(format_interval_unit('weekly', 1), 'week')
+        self.assertEqual(format_interval_unit('daily', 1), 'day')
+
+    def test_plural_otherwise(self):
+        self.assertEqual(format_interval_unit('weekly', 2), 'weeks')
+        self.assertEqual(format_interval_unit('monthly', 0), 'months')
+        self.assertEqual(format_interval_unit('quarterly', 3), 'quarters')
+        self.assertEqual(format_interval_unit('yearly', 5), 'years')
+
+    def test_unknown_interval_falls_back_to_its_name(self):
+        self.assertEqual(format_interval_unit('fortnight', 1), 'fortnight')
+        self.assertEqual(format_interval_unit('fortnight', 2), 'fortnights')
+
+
+if __name__ == '__main__':
+    unittest.main()
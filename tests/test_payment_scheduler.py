@@ -1153,5 +1153,44 @@ class TestGetPayeeIncomeInMonth(unittest.TestCase):
     
 
 
+class TestFindExtremes(unittest.TestCase):
+    """Tests for PaymentScheduler._find_extremes."""
+    
+    def test_empty_input(self):
+        """No months gives zero amounts and no months."""
+        self.assertEqual(PaymentScheduler._find_extremes([]), (0.0, 0.0, [], []))
+    
+    def test_single_month_is_both_min_and_max(self):
+        """A single month is both the minimum and the maximum."""
+        result = PaymentScheduler._find_extremes([((2025, 1), 50.0)])
+        self.assertEqual(result, (50.0, 50.0, [(2025, 1)], [(2025, 1)]))
+    
+    def test_ties_keep_all_months_in_order(self):
+        """Every month sharing the min or max amount is returned, in input order."""
+        result = PaymentScheduler._find_extremes([
+            ((2025, 1), 100.0),
+            ((2025, 2), 50.0),
+            ((2025, 3), 100.0),
+            ((2025, 4), 50.0),
+            ((2025, 5), 75.0),
+        ])
+        self.assertEqual(result, (50.0, 100.0, [(2025, 2), (2025, 4)], [(2025, 1), (2025, 3)]))
+    
+    def test_new_extreme_replaces_earlier_ties(self):
+        """A lower (or higher) amount discards months tied at the previous extreme."""
+        result = PaymentScheduler._find_extremes([
+            ((2025, 1), 20.0),
+            ((2025, 2), 20.0),
+            ((2025, 3), 10.0),
+            ((2025, 4), 30.0),
+        ])
+        self.assertEqual(result, (10.0, 30.0, [(2025, 3)], [(2025, 4)]))
+    
+    def test_accepts_a_generator(self):
+        """The amounts are consumed in a single pass, so a generator works."""
+        amounts = ((key, amount) for key, amount in [("a", 3.0), ("b", 1.0)])
+        self.assertEqual(PaymentScheduler._find_extremes(amounts), (1.0, 3.0, ["b"], ["a"]))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,65 @@
+import unittest
+from datetime import date
+from models.bill import BillPriceHistory
+from models.payee import Payee
+from models.recurrence import Recurrence
+from models.state_file import StateFile
+
+
+class TestFindPayee(unittest.TestCase):
+    """Case-insensitive payee lookups, which must track changes to the payee list."""
+
+    def setUp(self):
+        self.alice = Payee(name="Alice")
+        self.bob = Payee(name="Bob")
+        self.state = StateFile(payees=[self.alice, self.bob])
+
+    def test_case_insensitive_lookup(self):
+        self.assertIs(self.state.find_payee("aLiCe"), self.alice)
+        self.assertIsNone(self.state.find_payee("Charlie"))
+
+    def test_added_payee_is_found(self):
+        self.state.find_payee("alice")
+        charlie = Payee(name="Charlie")
+        self.state.payees.append(charlie)
+        self.assertIs(self.state.find_payee("charlie"), charlie)
+
+    def test_renamed_payee_is_found_under_new_name_only(self):
+        self.state.find_payee("bob")
+        self.bob.name = "Robert"
+        self.assertIs(self.state.find_payee("robert"), self.bob)
+        self.assertIsNone(self.state.find_payee("bob"))
+
+    def test_replaced_payee_with_same_count(self):
+        self.state.find_payee("bob")
+        new_bob = Payee(name="Bob")
+        self.state.payees[1] = new_bob
+        self.assertIs(self.state.find_payee("bob"), new_bob)
+
+    def test_removed_payee_is_not_found(self):
+        self.state.find_payee("bob")
+        self.state.payees.remove(self.bob)
+        self.assertIsNone(self.state.find_payee("bob"))
+
+    def test_first_of_case_insensitive_duplicates_wins(self):
+        other_alice = Payee(name="ALICE")
+        self.state.payees.append(other_alice)
+        self.assertIs(self.state.find_payee("alice"), self.alice)
+
+
+class TestStateFileDates(unittest.TestCase):
+    """Dates read from the state file, which need not be zero-padded."""
+
+    def test_recurrence_accepts_unpadded_dates(self):
+        recurrence = Recurrence.from_dict({'kind': 'calendar', 'interval': 'monthly',
+                                           'start': '2025-1-5', 'end': '2025-12-5'})
+        self.assertEqual(recurrence.start, date(2025, 1, 5))
+        self.assertEqual(recurrence.end, date(2025, 12, 5))
+
+    def test_price_history_accepts_unpadded_start_date(self):
+        history = BillPriceHistory.from_dict({'amount': 100.0, 'start_date': '2025-1-5'})
+        self.assertEqual(history.start_date, date(2025, 1, 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
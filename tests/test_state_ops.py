@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import patch
+from helpers import state_ops
+from models.payee import Payee, PaySchedule
+from models.recurrence import Recurrence
+from models.state_file import StateFile
+
+
+class TestSaveState(unittest.TestCase):
+    """Atomic writes and unchanged-content skipping in save_state."""
+
+    def setUp(self):
+        """Point the active state file at a fresh temp directory."""
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'household.yaml')
+        patcher = patch.object(state_ops, 'get_active_state_file', side_effect=lambda: self.filename)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.directory)
+        state_ops._state_digests.clear()
+        state_ops._load_state_file.cache_clear()
+
+    def make_state(self, *names):
+        """Helper method to create a StateFile with the given monthly-paid payees."""
+        recurrence = Recurrence(kind='calendar', interval='monthly', start=date(2025, 1, 1))
+        return StateFile(payees=[
+            Payee(name=name, pay_schedules=[PaySchedule(amount=1000.0, recurrence=recurrence)])
+            for name in names
+        ])
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_save_writes_loadable_state_and_no_temp_files(self):
+        state_ops.save_state(self.make_state("Alice"))
+        self.assertEqual(os.listdir(self.directory), ['household.yaml'])
+        self.assertEqual([p.name for p in state_ops.load_state().payees], ["Alice"])
+
+    def test_save_keeps_file_permissions(self):
+        state_ops.save_state(self.make_state("Alice"))
+        os.chmod(self.filename, 0o640)
+        state_ops.save_state(self.make_state("Bob"))
+        self.assertEqual(os.stat(self.filename).st_mode & 0o777, 0o640)
+
+    def test_new_file_gets_umask_permissions(self):
+        # A fresh file should get the mode open() would give it, not mkstemp's 0600
+        old_umask = os.umask(0o022)
+        self.addCleanup(os.umask, old_umask)
+        state_ops.save_state(self.make_state("Alice"))
+        self.assertEqual(os.stat(self.filename).st_mode & 0o777, 0o644)
+
+        os.remove(self.filename)
+        os.umask(0o027)
+        state_ops.save_state(self.make_state("Bob"))
+        self.assertEqual(os.stat(self.filename).st_mode & 0o777, 0o640)
+
+    def test_save_through_symlink_updates_target(self):
+        target = os.path.join(self.directory, 'real.yaml')
+        state_ops.save_state(self.make_state("Alice"))
+        os.rename(self.filename, target)
+        os.symlink(target, self.filename)
+
+        state_ops.save_state(self.make_state("Bob"))
+
+        self.assertTrue(os.path.islink(self.filename))
+        self.assertIn(b'Bob', self.read(target))
+        self.assertEqual(sorted(os.listdir(self.directory)), ['household.yaml', 'real.yaml'])
+
+    def test_unchanged_state_is_not_rewritten(self):
+        state_ops.save_state(self.make_state("Alice"))
+        with patch.object(state_ops.tempfile, 'mkstemp', wraps=tempfile.mkstemp) as mkstemp:
+            state_ops.save_state(self.make_state("Alice"))
+            mkstemp.assert_not_called()
+            state_ops.save_state(self.make_state("Alice", "Bob"))
+            mkstemp.assert_called_once()
+
+    def test_unchanged_state_after_load_is_not_rewritten(self):
+        state_ops.save_state(self.make_state("Alice"))
+        state_ops._state_digests.clear()
+        state = state_ops.load_state()
+        with patch.object(state_ops.tempfile, 'mkstemp', wraps=tempfile.mkstemp) as mkstemp:
+            state_ops.save_state(state)
+            mkstemp.assert_not_called()
+
+    def test_deleted_file_is_written_again(self):
+        state_ops.save_state(self.make_state("Alice"))
+        os.remove(self.filename)
+        state_ops.save_state(self.make_state("Alice"))
+        self.assertTrue(os.path.exists(self.filename))
+
+    def test_failed_replace_keeps_original_and_removes_temp(self):
+        state_ops.save_state(self.make_state("Alice"))
+        original = self.read(self.filename)
+        with patch.object(state_ops.os, 'replace', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                state_ops.save_state(self.make_state("Bob"))
+        self.assertEqual(self.read(self.filename), original)
+        self.assertEqual(os.listdir(self.directory), ['household.yaml'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,9 @@
-from .payment_schedule_display import PaymentScheduleDisplay
+__all__ = ['PaymentScheduleDisplay']
 
-__all__ = ['PaymentScheduleDisplay']
\ No newline at end of file
+
+def __getattr__(name):
+    # Load the display module on first use so importing tui.console stays cheap
+    if name == 'PaymentScheduleDisplay':
+        from .payment_schedule_display import PaymentScheduleDisplay
+        return PaymentScheduleDisplay
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
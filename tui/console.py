@@ -0,0 +1,5 @@
+"""Shared Rich console for the CLI, so the terminal is probed once per process."""
+
+from rich.console import Console
+
+console = Console()
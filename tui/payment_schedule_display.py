@@ -21,21 +21,13 @@ class PaymentScheduleDisplay:
     def _get_payee_colors(self, result: PaymentScheduleResult) -> Dict[str, str]:
         """Get Rich-compatible colors for all payees in the result."""
         # Extract unique payees from schedule items
-        payees = list(set(item.payee_name for item in result.schedule_items))
-        payees.sort()  # Ensure consistent ordering
-        
-        colors = {}
-        for i, payee_name in enumerate(payees):
-            colors[payee_name] = self.color_generator.get_payee_color(i, 'rich')
-        
-        return colors
+        payees = sorted({item.payee_name for item in result.schedule_items})  # Ensure consistent ordering
+        return dict(zip(payees, self.color_generator.get_palette(len(payees), 'rich')))
     
     def _get_payee_colors_for_all_payees(self, all_payees: List) -> Dict[str, str]:
         """Get Rich-compatible colors for all payees (including inactive ones)."""
-        colors = {}
-        for i, payee in enumerate(all_payees):
-            colors[payee.name] = self.color_generator.get_payee_color(i, 'rich')
-        return colors
+        palette = self.color_generator.get_palette(len(all_payees), 'rich')
+        return {payee.name: color for payee, color in zip(all_payees, palette)}
     
     def display_pivot_table(self, result: PaymentScheduleResult, show_zero_contribution: bool = False, all_payees: List = None) -> None:
         """Display payment schedule as a rich pivot table."""
@@ -107,9 +99,6 @@ class PaymentScheduleDisplay:
             header_text = f"[{payee_color}]{payee_name}[/{payee_color}]\n{schedule_desc}"
             table.add_column(header_text, justify="right", style="green")
         
-        # Sort months chronologically
-        sorted_months = sorted(monthly_data.keys())
-        
         # We want to display months_ahead bill months starting from start_month
         # The income data keys represent when income is received, which is used for the NEXT month's bills
         # So we need to find income months that correspond to our desired bill months
@@ -455,9 +444,6 @@ class PaymentScheduleDisplay:
             header_text = f"[{payee_color}]{payee_name}[/{payee_color}]\n{schedule}"
             table.add_column(header_text, justify="right", style="green")
         
-        # Sort months chronologically
-        sorted_months = sorted(monthly_data.keys())
-        
         # We want to display months_ahead bill months starting from start_month
         # The income data keys represent when income is received, which is used for the NEXT month's bills
         # So we need to find income months that correspond to our desired bill months